@@ -15,21 +15,66 @@ command template plus regexes for metric extraction.
 from __future__ import annotations
 
 import argparse
+import functools
 import html
+import io
 import json
 import os
+import queue
 import re
-import statistics
+import shlex
+import string
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import IO, Any, Callable, Deque, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+try:  # Optional: summary statistics are computed column-wise in C when present.
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - environment dependent
+    np = None
+
+try:  # Optional: orjson encodes large result trees much faster than stdlib json.
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - environment dependent
+    orjson = None
+
+
+def json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_indented(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
+# Lines of child stdout/stderr kept per stream; older output is dropped as it arrives.
+OUTPUT_TAIL_LINES = 2048
+# Characters of each stream's tail stored per run record.
+RECORD_TAIL_CHARS = 1200
+# Handshake lines for persistent workers; see llama_cpp_runner.py --server.
+WORKER_READY_MARKER = "==READY=="
+WORKER_END_MARKER = "==END=="
+# Exit code recorded when the backend cannot be launched at all, matching what
+# /bin/sh reports for a missing command.
+LAUNCH_FAILED_EXIT_CODE = 127
 
 
 @dataclass
@@ -49,6 +94,59 @@ class MetricConfig:
         return cls(key=key, unit=unit, direction=direction)
 
 
+class RunLog:
+    """Thread-safe NDJSON sink that receives one line per measured run."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._file = path.open("wb")
+        self._lock = threading.Lock()
+
+    def write(self, backend_name: str, entry: Dict[str, Any]) -> None:
+        line = json_dumps_compact({"backend": backend_name, **entry}) + b"\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+@dataclass
+class RunSettings:
+    metric: MetricConfig
+    variables: Dict[str, str]
+    base_env: Dict[str, str]
+    runs: int
+    warmup_runs: int
+    timeout_s: int
+    strict: bool
+    metric_fallback_to_wall_time: bool
+    run_log: RunLog
+
+
+class BenchmarkAbort(Exception):
+    """Raised when a strict-mode failure must stop the whole benchmark.
+
+    ``row`` carries the failing backend's partial result so it can still be
+    reported alongside the backends that finished.
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.row: Optional[Dict[str, Any]] = None
+
+
+_print_lock = threading.Lock()
+
+
+def log(message: str, *, error: bool = False) -> None:
+    # Backends may run on worker threads; keep their progress lines whole.
+    with _print_lock:
+        print(message, file=sys.stderr if error else sys.stdout, flush=True)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run GGUF backend comparisons.")
     parser.add_argument(
@@ -100,18 +198,17 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_config(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return json_loads(path.read_bytes())
 
 
-def percentile(values: Sequence[float], p: float) -> float:
-    if not values:
-        raise ValueError("percentile() requires at least one value")
+def percentile_sorted(sorted_values: Sequence[float], p: float) -> float:
+    """Linear-interpolated percentile of an already ascending-sorted sequence."""
+    if not sorted_values:
+        raise ValueError("percentile_sorted() requires at least one value")
     if p <= 0:
-        return min(values)
+        return sorted_values[0]
     if p >= 100:
-        return max(values)
-    sorted_values = sorted(values)
+        return sorted_values[-1]
     k = (len(sorted_values) - 1) * (p / 100.0)
     lower = int(k)
     upper = min(lower + 1, len(sorted_values) - 1)
@@ -124,19 +221,65 @@ def percentile(values: Sequence[float], p: float) -> float:
 def summarize(values: Sequence[float]) -> Dict[str, float]:
     if not values:
         return {}
-    data = list(values)
+    # Sort once; median/min/max/p95 all read from the sorted copy.
+    data = sorted(values)
+    n = len(data)
+    mean = sum(data) / n
+    mid = n // 2
+    median = data[mid] if n % 2 else 0.5 * (data[mid - 1] + data[mid])
+    stdev = (sum((x - mean) ** 2 for x in data) / n) ** 0.5 if n > 1 else 0.0
     return {
-        "mean": float(statistics.mean(data)),
-        "median": float(statistics.median(data)),
-        "min": float(min(data)),
-        "max": float(max(data)),
-        "p95": float(percentile(data, 95.0)),
-        "stdev": float(statistics.pstdev(data)) if len(data) > 1 else 0.0,
+        "mean": float(mean),
+        "median": float(median),
+        "min": float(data[0]),
+        "max": float(data[-1]),
+        "p95": float(percentile_sorted(data, 95.0)),
+        "stdev": float(stdev),
     }
 
 
+def summarize_many(series: Sequence[Sequence[float]]) -> List[Dict[str, float]]:
+    """Summarize several value lists at once; same output as ``summarize`` per list."""
+    if np is None:
+        return [summarize(values) for values in series]
+
+    # Aux metrics can be missing from some runs, so only equal-length series
+    # share a 2-D array.
+    by_length: Dict[int, List[int]] = {}
+    for idx, values in enumerate(series):
+        by_length.setdefault(len(values), []).append(idx)
+
+    out: List[Dict[str, float]] = [{} for _ in series]
+    for n, indices in by_length.items():
+        if n == 0:
+            continue
+        arr = np.array([series[idx] for idx in indices], dtype=np.float64)
+        means = arr.mean(axis=1)
+        medians = np.median(arr, axis=1)
+        mins = arr.min(axis=1)
+        maxs = arr.max(axis=1)
+        p95s = np.percentile(arr, 95.0, axis=1)
+        stdevs = arr.std(axis=1) if n > 1 else np.zeros(len(indices))
+        for row, idx in enumerate(indices):
+            out[idx] = {
+                "mean": float(means[row]),
+                "median": float(medians[row]),
+                "min": float(mins[row]),
+                "max": float(maxs[row]),
+                "p95": float(p95s[row]),
+                "stdev": float(stdevs[row]),
+            }
+    return out
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_posix(path: str) -> str:
+    return Path(path).resolve().as_posix()
+
+
 def to_posix(path: Path) -> str:
-    return path.resolve().as_posix()
+    # resolve() stats/readlinks every component; the same few paths recur per backend.
+    return _resolve_posix(str(path))
 
 
 def build_template_variables(config: Dict[str, Any]) -> Dict[str, str]:
@@ -164,30 +307,70 @@ def build_template_variables(config: Dict[str, Any]) -> Dict[str, str]:
     return variables
 
 
+@functools.lru_cache(maxsize=256)
+def compile_template(template: str) -> Callable[[Dict[str, str]], str]:
+    """Pre-split a ``str.format`` template into a render function over plain lookups."""
+    chunks = list(string.Formatter().parse(template))
+    if any(
+        spec or conversion or (field is not None and not field.isidentifier())
+        for _, field, spec, conversion in chunks
+    ):
+        # Format specs, conversions and attribute/index fields keep the generic path.
+        return lambda variables: template.format(**variables)
+    parts = [(literal, field) for literal, field, _, _ in chunks]
+
+    def render(variables: Dict[str, str]) -> str:
+        return "".join(literal + (variables[field] if field is not None else "") for literal, field in parts)
+
+    return render
+
+
 def format_command(template: str, variables: Dict[str, str]) -> str:
     try:
-        return template.format(**variables)
+        return compile_template(template)(variables)
     except KeyError as exc:
         raise ValueError(f"missing template variable '{exc.args[0]}' in command: {template}") from exc
 
 
-def parse_backend_filters(raw: str) -> List[str]:
-    return [item.strip().lower() for item in raw.split(",") if item.strip()]
+def split_command(command: str) -> Union[str, List[str]]:
+    """Tokenize a rendered command for ``shell=False`` execution."""
+    if os.name == "nt":
+        # CreateProcess parses the command line itself, and POSIX shlex rules
+        # would mangle backslash paths.
+        return command
+    return shlex.split(command)
+
 
+def parse_backend_filters(raw: str) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """Split ``--backend`` into an exact-name set and substring tokens."""
+    tokens = tuple(dict.fromkeys(item.strip().lower() for item in raw.split(",") if item.strip()))
+    return frozenset(tokens), tokens
 
-def backend_is_selected(name: str, filters: Sequence[str]) -> bool:
-    if not filters:
+
+def backend_is_selected(lower_name: str, filters: Tuple[FrozenSet[str], Tuple[str, ...]]) -> bool:
+    """Match an already lower-cased backend name: exact hit first, then substrings."""
+    exact, substrings = filters
+    if not substrings:
+        return True
+    if lower_name in exact:
         return True
-    lower_name = name.lower()
-    return any(token == lower_name or token in lower_name for token in filters)
+    return any(token in lower_name for token in substrings)
 
 
-def parse_numeric_metric(text: str, regexes: Iterable[str]) -> Optional[float]:
-    for pattern in regexes:
-        match = re.search(pattern, text, flags=re.IGNORECASE | re.MULTILINE)
+@functools.lru_cache(maxsize=512)
+def compile_regex(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+
+
+def match_numeric_metric(
+    text: str, regexes: Sequence[re.Pattern[str]], limit: int
+) -> Optional[Tuple[int, float]]:
+    """Return (rank, value) for the first of ``regexes[:limit]`` that matches ``text``."""
+    for rank in range(min(limit, len(regexes))):
+        match = regexes[rank].search(text)
         if match:
             try:
-                return float(match.group(1))
+                return rank, float(match.group(1))
             except ValueError:
                 continue
     return None
@@ -203,53 +386,300 @@ def normalize_regexes(raw: Any) -> List[str]:
     raise ValueError("metric regex must be string or list of strings")
 
 
+class StreamScanner:
+    """Keeps a bounded tail of one child stream and scans it line by line for metrics.
+
+    ``patterns`` maps a metric key (``None`` for the primary metric) to its
+    regexes in priority order. Once a key has matched, only higher-priority
+    regexes are tried on later lines, so fully resolved keys cost nothing.
+    """
+
+    def __init__(self, patterns: Dict[Optional[str], List[re.Pattern[str]]]):
+        self.patterns = patterns
+        self.tail: Deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+        self.hits: Dict[Optional[str], Tuple[int, float]] = {}
+
+    def feed(self, line: str) -> None:
+        self.tail.append(line)
+        for key, regexes in self.patterns.items():
+            best = self.hits.get(key)
+            limit = best[0] if best is not None else len(regexes)
+            if limit == 0:
+                continue
+            found = match_numeric_metric(line, regexes, limit)
+            if found is not None:
+                self.hits[key] = found
+
+    def drain(self, stream: IO[str]) -> None:
+        for line in stream:
+            self.feed(line)
+        stream.close()
+
+    def text(self, limit: int) -> str:
+        return "".join(self.tail)[-limit:] if limit > 0 else ""
+
+
+def merge_hits(scanners: Sequence[StreamScanner], key: Optional[str]) -> Optional[float]:
+    # Lower regex rank wins; ties go to the earlier stream (stdout before stderr).
+    best: Optional[Tuple[int, int, float]] = None
+    for stream_rank, scanner in enumerate(scanners):
+        hit = scanner.hits.get(key)
+        if hit is not None and (best is None or (hit[0], stream_rank) < best[:2]):
+            best = (hit[0], stream_rank, hit[1])
+    return best[2] if best is not None else None
+
+
+class PersistentWorker:
+    """Long-lived backend process that answers one JSON request per stdin line.
+
+    The worker prints WORKER_READY_MARKER once its model is loaded, then for
+    every request line the usual metric output followed by WORKER_END_MARKER
+    on stderr and then on stdout. The stderr marker lets the harness drain
+    that stream up to the end of the response, so late stderr lines are not
+    lost or credited to the next run. Only the request/response exchange is
+    timed, so model load is paid once per backend instead of once per run.
+    A worker that dies or times out is restarted on the next request.
+    """
+
+    def __init__(
+        self,
+        *,
+        command: Union[str, List[str]],
+        cwd: Path,
+        env: Dict[str, str],
+        shell: bool,
+        payload: Dict[str, Any],
+        timeout_s: int,
+    ):
+        self.command = command
+        self.cwd = cwd
+        self.env = env
+        self.shell = shell
+        self.request_line = json.dumps(payload) + "\n"
+        self.timeout_s = timeout_s
+        self.proc: Optional[subprocess.Popen[str]] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._err_scanner: Optional[StreamScanner] = None
+        self._err_done = threading.Event()
+
+    def _pump_stdout(self, stream: IO[str], lines: "queue.Queue[Optional[str]]") -> None:
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def _pump_stderr(self, stream: IO[str], done: threading.Event) -> None:
+        for line in stream:
+            if line.rstrip("\r\n") == WORKER_END_MARKER:
+                done.set()
+                continue
+            scanner = self._err_scanner
+            if scanner is not None:
+                scanner.feed(line)
+        # A dead worker sends no marker; do not leave a request waiting on it.
+        done.set()
+
+    def _read_line(self, deadline: float) -> Optional[str]:
+        try:
+            return self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            self.close()
+            raise subprocess.TimeoutExpired(self.command, self.timeout_s) from None
+
+    def start(self) -> None:
+        self._lines = queue.Queue()
+        self._err_done = threading.Event()
+        self.proc = subprocess.Popen(
+            self.command,
+            cwd=str(self.cwd),
+            env=self.env,
+            shell=self.shell,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+        threading.Thread(target=self._pump_stdout, args=(self.proc.stdout, self._lines), daemon=True).start()
+        threading.Thread(target=self._pump_stderr, args=(self.proc.stderr, self._err_done), daemon=True).start()
+        deadline = time.monotonic() + self.timeout_s
+        while True:
+            line = self._read_line(deadline)
+            if line is None or line.rstrip("\r\n") == WORKER_READY_MARKER:
+                return
+
+    def ensure_started(self) -> None:
+        if self.proc is None or self.proc.poll() is not None:
+            self.close()
+            self.start()
+
+    def request(self, out_scanner: Optional[StreamScanner], err_scanner: Optional[StreamScanner]) -> int:
+        """Send one request, feeding its output to the scanners; return an exit-code-like status.
+
+        Without scanners the response is still consumed up to the end marker,
+        just not retained.
+        """
+        assert self.proc is not None and self.proc.stdin is not None
+        self._err_scanner = err_scanner
+        err_done = self._err_done
+        err_done.clear()
+        try:
+            try:
+                self.proc.stdin.write(self.request_line)
+                self.proc.stdin.flush()
+            except (BrokenPipeError, OSError):
+                return self.proc.wait() or 1
+            deadline = time.monotonic() + self.timeout_s
+            while True:
+                line = self._read_line(deadline)
+                if line is None:
+                    # Worker exited without finishing the response.
+                    return self.proc.wait() or 1
+                if line.rstrip("\r\n") == WORKER_END_MARKER:
+                    # stderr is a separate pipe; wait until it is drained up to its own marker.
+                    if not err_done.wait(timeout=max(0.0, deadline - time.monotonic())):
+                        self.close()
+                        raise subprocess.TimeoutExpired(self.command, self.timeout_s)
+                    return 0
+                if out_scanner is not None:
+                    out_scanner.feed(line)
+        finally:
+            self._err_scanner = None
+
+    def close(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+
 def run_once(
     *,
     backend_name: str,
-    command: str,
+    command: Union[str, List[str]],
     cwd: Path,
     timeout_s: int,
     env: Dict[str, str],
-    metric_regexes: List[str],
-    aux_regexes: Dict[str, List[str]],
+    shell: bool,
+    metric_regexes: List[re.Pattern[str]],
+    aux_regexes: Dict[str, List[re.Pattern[str]]],
     metric_fallback_to_wall_time: bool,
+    worker: Optional[PersistentWorker] = None,
+    tail_chars: int = RECORD_TAIL_CHARS,
+    discard_output: bool = False,
 ) -> Dict[str, Any]:
-    start = time.perf_counter()
-    proc = subprocess.run(
-        command,
-        cwd=str(cwd),
-        env=env,
-        shell=True,
-        capture_output=True,
-        text=True,
-        timeout=timeout_s,
-    )
-    end = time.perf_counter()
-    wall_s = end - start
-    combined = (proc.stdout or "") + "\n" + (proc.stderr or "")
+    """Run one benchmark iteration.
+
+    With ``discard_output`` (warmups) the child's output is sent to DEVNULL
+    and neither buffered nor parsed; only wall time and exit code are returned.
+    """
+    out_scanner: Optional[StreamScanner] = None
+    err_scanner: Optional[StreamScanner] = None
+    if not discard_output:
+        patterns: Dict[Optional[str], List[re.Pattern[str]]] = {None: metric_regexes, **aux_regexes}
+        out_scanner = StreamScanner(patterns)
+        err_scanner = StreamScanner(patterns)
 
-    primary_metric = parse_numeric_metric(combined, metric_regexes)
+    try:
+        if worker is not None:
+            worker.ensure_started()
+            start = time.perf_counter()
+            exit_code = worker.request(out_scanner, err_scanner)
+            wall_s = time.perf_counter() - start
+        else:
+            exit_code, wall_s = run_process(
+                command=command,
+                cwd=cwd,
+                timeout_s=timeout_s,
+                env=env,
+                shell=shell,
+                out_scanner=out_scanner,
+                err_scanner=err_scanner,
+            )
+    except OSError as exc:
+        # Without a shell, a missing or non-executable binary raises here
+        # instead of exiting 127; record it as a failed run the same way.
+        exit_code, wall_s = LAUNCH_FAILED_EXIT_CODE, 0.0
+        if err_scanner is not None:
+            err_scanner.feed(f"Failed to launch backend: {exc}\n")
+
+    if out_scanner is None or err_scanner is None:
+        return {"wall_seconds": wall_s, "exit_code": exit_code}
+
+    scanners = (out_scanner, err_scanner)
+    primary_metric = merge_hits(scanners, None)
     if primary_metric is None and metric_fallback_to_wall_time:
         primary_metric = wall_s
 
     aux_metrics: Dict[str, float] = {}
-    for key, regexes in aux_regexes.items():
-        value = parse_numeric_metric(combined, regexes)
+    for key in aux_regexes:
+        value = merge_hits(scanners, key)
         if value is not None:
             aux_metrics[key] = value
 
     return {
         "backend": backend_name,
         "command": command,
-        "exit_code": int(proc.returncode),
+        "exit_code": exit_code,
         "wall_seconds": wall_s,
         "primary_metric": primary_metric,
         "aux_metrics": aux_metrics,
-        "stdout": proc.stdout,
-        "stderr": proc.stderr,
+        "stdout_tail": out_scanner.text(tail_chars),
+        "stderr_tail": err_scanner.text(tail_chars),
     }
 
 
+def run_process(
+    *,
+    command: Union[str, List[str]],
+    cwd: Path,
+    timeout_s: int,
+    env: Dict[str, str],
+    shell: bool,
+    out_scanner: Optional[StreamScanner],
+    err_scanner: Optional[StreamScanner],
+) -> Tuple[int, float]:
+    """Run one child process to completion, streaming its output into the scanners.
+
+    Streams without a scanner go straight to DEVNULL.
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        command,
+        cwd=str(cwd),
+        env=env,
+        shell=shell,
+        stdout=subprocess.PIPE if out_scanner is not None else subprocess.DEVNULL,
+        stderr=subprocess.PIPE if err_scanner is not None else subprocess.DEVNULL,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    )
+    readers = [
+        threading.Thread(target=scanner.drain, args=(stream,), daemon=True)
+        for scanner, stream in ((out_scanner, proc.stdout), (err_scanner, proc.stderr))
+        if scanner is not None
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        proc.wait(timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    end = time.perf_counter()
+    for reader in readers:
+        reader.join()
+    return int(proc.returncode), end - start
+
+
 def output_stem(config: Dict[str, Any]) -> str:
     name = str(config.get("benchmark_name", "gguf_compare")).strip() or "gguf_compare"
     safe = "".join(ch if ch.isalnum() or ch in {"_", "-"} else "_" for ch in name)
@@ -270,27 +700,29 @@ def generate_markdown_report(result: Dict[str, Any], metric: MetricConfig) -> st
     bench = result["benchmark"]
     rows = result["results"]
 
-    lines: List[str] = []
-    lines.append(f"# GGUF Benchmark Report: {bench['benchmark_name']}")
-    lines.append("")
-    lines.append(f"- Timestamp (UTC): `{bench['timestamp_utc']}`")
-    lines.append(f"- Hardware: `{bench['hardware']}`")
-    lines.append(f"- Model: `{bench['model_name']}`")
-    lines.append(f"- Model path: `{bench['model_path']}`")
-    lines.append(f"- Runs: `{bench['runs']}` measured + `{bench['warmup_runs']}` warmup")
-    lines.append(f"- Metric: `{metric.key}` ({metric.unit}, {metric.direction} is better)")
-    lines.append("")
-
-    lines.append("## Summary")
-    lines.append("")
-    lines.append("| Backend | Status | Median metric | Mean metric | Median wall (s) | Success runs | Failed runs |")
-    lines.append("|---|---:|---:|---:|---:|---:|---:|")
+    out = io.StringIO()
+    out.write(f"# GGUF Benchmark Report: {bench['benchmark_name']}\n")
+    out.write("\n")
+    out.write(f"- Timestamp (UTC): `{bench['timestamp_utc']}`\n")
+    out.write(f"- Hardware: `{bench['hardware']}`\n")
+    out.write(f"- Model: `{bench['model_name']}`\n")
+    out.write(f"- Model path: `{bench['model_path']}`\n")
+    out.write(f"- Runs: `{bench['runs']}` measured + `{bench['warmup_runs']}` warmup\n")
+    out.write(f"- Metric: `{metric.key}` ({metric.unit}, {metric.direction} is better)\n")
+    if bench.get("status") == "aborted":
+        out.write(f"- Status: `aborted` ({bench.get('abort_reason')})\n")
+    out.write("\n")
+
+    out.write("## Summary\n")
+    out.write("\n")
+    out.write("| Backend | Status | Median metric | Mean metric | Median wall (s) | Success runs | Failed runs |\n")
+    out.write("|---|---:|---:|---:|---:|---:|---:|\n")
     for entry in rows:
         summary = entry.get("summary", {})
         metric_summary = summary.get("primary_metric", {})
         wall_summary = summary.get("wall_seconds", {})
-        lines.append(
-            "| {name} | {status} | {med} | {mean} | {wall} | {ok} | {fail} |".format(
+        out.write(
+            "| {name} | {status} | {med} | {mean} | {wall} | {ok} | {fail} |\n".format(
                 name=entry["name"],
                 status=entry["status"],
                 med=format_float(metric_summary.get("median"), 4),
@@ -301,24 +733,45 @@ def generate_markdown_report(result: Dict[str, Any], metric: MetricConfig) -> st
             )
         )
 
-    lines.append("")
-    lines.append("## Ranking")
-    lines.append("")
+    out.write("\n")
+    out.write("## Ranking\n")
+    out.write("\n")
     ranked = [r for r in rows if r.get("status") == "ok" and r.get("summary", {}).get("primary_metric", {}).get("median") is not None]
     ranked.sort(key=lambda r: ranking_key(metric.direction, float(r["summary"]["primary_metric"]["median"])))
     for idx, entry in enumerate(ranked, start=1):
         med = entry["summary"]["primary_metric"]["median"]
-        lines.append(f"{idx}. `{entry['name']}`: `{med:.4f} {metric.unit}`")
+        out.write(f"{idx}. `{entry['name']}`: `{med:.4f} {metric.unit}`\n")
 
     if not ranked:
-        lines.append("- No successful backend metrics.")
+        out.write("- No successful backend metrics.\n")
 
-    lines.append("")
-    lines.append("## Notes")
-    lines.append("")
-    lines.append("- Report generated by `benchmarks/gguf/gguf_compare.py`.")
-    lines.append("- `median` is recommended for headline comparisons.")
-    return "\n".join(lines) + "\n"
+    out.write("\n")
+    out.write("## Notes\n")
+    out.write("\n")
+    out.write("- Report generated by `benchmarks/gguf/gguf_compare.py`.\n")
+    out.write("- `median` is recommended for headline comparisons.\n")
+    return out.getvalue()
+
+
+def _svg_row(
+    idx: int,
+    name: str,
+    value: float,
+    *,
+    left_pad: int,
+    row_h: int,
+    top_pad: int,
+    bar_area: int,
+    max_value: float,
+) -> str:
+    """Render one chart row (label, bar, value) as a single SVG fragment."""
+    y = top_pad + idx * row_h
+    bar_w = (value / max_value) * bar_area
+    return (
+        f'<text x="{left_pad - 10}" y="{y + 20}" text-anchor="end" font-family="Segoe UI, sans-serif" font-size="12" fill="#374151">{html.escape(name)}</text>\n'
+        f'<rect x="{left_pad}" y="{y + 6}" width="{bar_w:.2f}" height="18" fill="#2563eb" rx="3" ry="3"/>\n'
+        f'<text x="{left_pad + bar_w + 8:.2f}" y="{y + 20}" font-family="Segoe UI, sans-serif" font-size="12" fill="#111827">{value:.4f}</text>\n'
+    )
 
 
 def build_svg_chart(rows: List[Tuple[str, float]], metric: MetricConfig) -> str:
@@ -338,29 +791,43 @@ def build_svg_chart(rows: List[Tuple[str, float]], metric: MetricConfig) -> str:
     if max_value <= 0:
         max_value = 1.0
 
-    svg_lines = [
-        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">',
-        '<rect width="100%" height="100%" fill="#ffffff"/>',
-        f'<text x="{left_pad}" y="20" font-family="Segoe UI, sans-serif" font-size="14" fill="#111827">Median {html.escape(metric.key)} ({html.escape(metric.unit)})</text>',
-    ]
-
-    for idx, (name, value) in enumerate(rows):
-        y = top_pad + idx * row_h
-        bar_w = (value / max_value) * bar_area
-        label = html.escape(name)
-        value_text = f"{value:.4f}"
-        svg_lines.append(
-            f'<text x="{left_pad - 10}" y="{y + 20}" text-anchor="end" font-family="Segoe UI, sans-serif" font-size="12" fill="#374151">{label}</text>'
-        )
-        svg_lines.append(
-            f'<rect x="{left_pad}" y="{y + 6}" width="{bar_w:.2f}" height="18" fill="#2563eb" rx="3" ry="3"/>'
-        )
-        svg_lines.append(
-            f'<text x="{left_pad + bar_w + 8:.2f}" y="{y + 20}" font-family="Segoe UI, sans-serif" font-size="12" fill="#111827">{value_text}</text>'
+    header = (
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" xmlns="http://www.w3.org/2000/svg">\n'
+        '<rect width="100%" height="100%" fill="#ffffff"/>\n'
+        f'<text x="{left_pad}" y="20" font-family="Segoe UI, sans-serif" font-size="14" fill="#111827">Median {html.escape(metric.key)} ({html.escape(metric.unit)})</text>\n'
+    )
+    body = "".join(
+        _svg_row(
+            idx,
+            name,
+            value,
+            left_pad=left_pad,
+            row_h=row_h,
+            top_pad=top_pad,
+            bar_area=bar_area,
+            max_value=max_value,
         )
+        for idx, (name, value) in enumerate(rows)
+    )
+    return header + body + "</svg>"
+
 
-    svg_lines.append("</svg>")
-    return "\n".join(svg_lines)
+HTML_TABLE_ROW = "<tr><td>%s</td><td>%s</td><td>%s</td><td>%s</td><td>%s</td><td>%s</td><td>%s</td></tr>"
+
+
+def _html_table_row(entry: Dict[str, Any]) -> str:
+    summary = entry.get("summary", {})
+    metric_summary = summary.get("primary_metric", {})
+    wall_summary = summary.get("wall_seconds", {})
+    return HTML_TABLE_ROW % (
+        html.escape(entry["name"]),
+        html.escape(entry["status"]),
+        format_float(metric_summary.get("median"), 4),
+        format_float(metric_summary.get("mean"), 4),
+        format_float(wall_summary.get("median"), 4),
+        summary.get("success_runs", 0),
+        summary.get("failed_runs", 0),
+    )
 
 
 def generate_html_report(result: Dict[str, Any], metric: MetricConfig) -> str:
@@ -379,29 +846,26 @@ def generate_html_report(result: Dict[str, Any], metric: MetricConfig) -> str:
     chart_rows.sort(key=lambda item: ranking_key(metric.direction, item[1]))
     chart_svg = build_svg_chart(chart_rows, metric)
 
-    table_rows = []
-    for entry in rows:
-        summary = entry.get("summary", {})
-        metric_summary = summary.get("primary_metric", {})
-        wall_summary = summary.get("wall_seconds", {})
-        table_rows.append(
-            "<tr>"
-            f"<td>{html.escape(entry['name'])}</td>"
-            f"<td>{html.escape(entry['status'])}</td>"
-            f"<td>{format_float(metric_summary.get('median'), 4)}</td>"
-            f"<td>{format_float(metric_summary.get('mean'), 4)}</td>"
-            f"<td>{format_float(wall_summary.get('median'), 4)}</td>"
-            f"<td>{summary.get('success_runs', 0)}</td>"
-            f"<td>{summary.get('failed_runs', 0)}</td>"
-            "</tr>"
-        )
+    table_body = "".join(_html_table_row(entry) for entry in rows)
+
+    # Escape each metadata value once; the title and heading share the name.
+    e_name = html.escape(bench["benchmark_name"])
+    e_timestamp = html.escape(bench["timestamp_utc"])
+    e_hardware = html.escape(bench["hardware"])
+    e_model = html.escape(bench["model_name"])
+    e_model_path = html.escape(bench["model_path"])
+    e_metric = f"{html.escape(metric.key)} ({html.escape(metric.unit)}, {html.escape(metric.direction)} is better)"
+
+    status_html = ""
+    if bench.get("status") == "aborted":
+        status_html = f"\n    <div><strong>Status:</strong> aborted ({html.escape(str(bench.get('abort_reason')))})</div>"
 
     return f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>GGUF Benchmark Report - {html.escape(bench['benchmark_name'])}</title>
+  <title>GGUF Benchmark Report - {e_name}</title>
   <style>
     body {{
       font-family: "Segoe UI", Tahoma, sans-serif;
@@ -421,14 +885,14 @@ def generate_html_report(result: Dict[str, Any], metric: MetricConfig) -> str:
   </style>
 </head>
 <body>
-  <h1>GGUF Benchmark Report: {html.escape(bench['benchmark_name'])}</h1>
+  <h1>GGUF Benchmark Report: {e_name}</h1>
   <div class="meta">
-    <div><strong>Timestamp (UTC):</strong> {html.escape(bench['timestamp_utc'])}</div>
-    <div><strong>Hardware:</strong> {html.escape(bench['hardware'])}</div>
-    <div><strong>Model:</strong> {html.escape(bench['model_name'])}</div>
-    <div><strong>Model path:</strong> {html.escape(bench['model_path'])}</div>
+    <div><strong>Timestamp (UTC):</strong> {e_timestamp}</div>
+    <div><strong>Hardware:</strong> {e_hardware}</div>
+    <div><strong>Model:</strong> {e_model}</div>
+    <div><strong>Model path:</strong> {e_model_path}</div>
     <div><strong>Runs:</strong> {bench['runs']} measured + {bench['warmup_runs']} warmup</div>
-    <div><strong>Metric:</strong> {html.escape(metric.key)} ({html.escape(metric.unit)}, {html.escape(metric.direction)} is better)</div>
+    <div><strong>Metric:</strong> {e_metric}</div>{status_html}
   </div>
 
   <h2>Summary</h2>
@@ -445,7 +909,7 @@ def generate_html_report(result: Dict[str, Any], metric: MetricConfig) -> str:
       </tr>
     </thead>
     <tbody>
-      {''.join(table_rows)}
+      {table_body}
     </tbody>
   </table>
 
@@ -460,6 +924,196 @@ def generate_html_report(result: Dict[str, Any], metric: MetricConfig) -> str:
 """
 
 
+def run_backend(backend: Dict[str, Any], command: str, settings: RunSettings) -> Dict[str, Any]:
+    """Run warmups and measured runs for one backend and return its result row."""
+    name = str(backend["name"])
+    metric = settings.metric
+    variables = settings.variables
+    cwd_raw = str(backend.get("cwd", "."))
+    cwd_path = (REPO_ROOT / cwd_raw) if not Path(cwd_raw).is_absolute() else Path(cwd_raw)
+    overrides = {str(k): format_command(str(v), variables) for k, v in backend.get("env", {}).items()}
+    # Backends without overrides share the base environment as-is.
+    env = {**settings.base_env, **overrides} if overrides else settings.base_env
+
+    metric_regexes = normalize_regexes(backend.get("metric_regexes"))
+    if not metric_regexes:
+        parse_section = backend.get("parse", {})
+        metric_regexes = normalize_regexes(parse_section.get(metric.key))
+    if not metric_regexes and not settings.metric_fallback_to_wall_time:
+        raise ValueError(
+            f"Backend '{name}' has no metric regexes for '{metric.key}' and fallback is disabled."
+        )
+
+    aux_regexes: Dict[str, List[str]] = {}
+    parse_section = backend.get("parse", {})
+    aux_section = backend.get("aux_metrics", {})
+    for key, value in aux_section.items():
+        aux_regexes[str(key)] = normalize_regexes(value)
+    for key, value in parse_section.items():
+        if key == metric.key:
+            continue
+        if key not in aux_regexes:
+            aux_regexes[str(key)] = normalize_regexes(value)
+
+    # Exec the binary directly unless the backend needs pipes/redirects.
+    use_shell = bool(backend.get("shell", False))
+    argv = command if use_shell else split_command(command)
+
+    compiled_metric = [compile_regex(pattern) for pattern in metric_regexes]
+    compiled_aux = {key: [compile_regex(pattern) for pattern in value] for key, value in aux_regexes.items()}
+
+    log(f"\n== Backend: {name} ==\nCommand: {command}\nCWD: {cwd_path}")
+
+    runs = settings.runs
+    warmup_runs = settings.warmup_runs
+    timeout_s = settings.timeout_s
+    worker: Optional[PersistentWorker] = None
+    if backend.get("persistent", False):
+        worker = PersistentWorker(
+            command=argv,
+            cwd=cwd_path,
+            env=env,
+            shell=use_shell,
+            payload={"prompt": variables["prompt"], "max_tokens": int(variables["max_tokens"])},
+            timeout_s=timeout_s,
+        )
+
+    success_metrics: List[float] = []
+    success_wall: List[float] = []
+    aux_values: Dict[str, List[float]] = {}
+    failed_runs = 0
+
+    def result_row(status: str) -> Dict[str, Any]:
+        aux_keys = list(aux_values)
+        metric_summary, wall_summary, *aux_summaries = summarize_many(
+            [success_metrics, success_wall, *(aux_values[k] for k in aux_keys)]
+        )
+        return {
+            "name": name,
+            "status": status,
+            "command": command,
+            "cwd": to_posix(cwd_path),
+            "summary": {
+                "primary_metric": metric_summary,
+                "wall_seconds": wall_summary,
+                "success_runs": len(success_metrics),
+                "failed_runs": failed_runs,
+                "aux_metrics": dict(zip(aux_keys, aux_summaries)),
+            },
+        }
+
+    try:
+        for i in range(1, warmup_runs + 1):
+            log(f"[{name}] Warmup {i}/{warmup_runs}...")
+            try:
+                run_once(
+                    backend_name=name,
+                    command=argv,
+                    cwd=cwd_path,
+                    timeout_s=timeout_s,
+                    env=env,
+                    shell=use_shell,
+                    metric_regexes=compiled_metric,
+                    aux_regexes=compiled_aux,
+                    metric_fallback_to_wall_time=settings.metric_fallback_to_wall_time,
+                    worker=worker,
+                    discard_output=True,
+                )
+            except subprocess.TimeoutExpired:
+                if settings.strict:
+                    raise BenchmarkAbort(f"Backend '{name}' warmup {i} timed out after {timeout_s}s.")
+                log(f"[{name}] Warmup timeout (continuing because strict=false).")
+
+        for i in range(1, runs + 1):
+            log(f"[{name}] Run {i}/{runs}...")
+            try:
+                record = run_once(
+                    backend_name=name,
+                    command=argv,
+                    cwd=cwd_path,
+                    timeout_s=timeout_s,
+                    env=env,
+                    shell=use_shell,
+                    metric_regexes=compiled_metric,
+                    aux_regexes=compiled_aux,
+                    metric_fallback_to_wall_time=settings.metric_fallback_to_wall_time,
+                    worker=worker,
+                )
+            except subprocess.TimeoutExpired:
+                failed_runs += 1
+                settings.run_log.write(
+                    name,
+                    {
+                        "run_index": i,
+                        "ok": False,
+                        "error": f"timeout after {timeout_s}s",
+                    },
+                )
+                if settings.strict:
+                    raise BenchmarkAbort(f"Backend '{name}' run {i} timed out in strict mode; aborting benchmark.")
+                continue
+
+            ok = (record["exit_code"] == 0) and (record["primary_metric"] is not None)
+            settings.run_log.write(
+                name,
+                {
+                    "run_index": i,
+                    "ok": ok,
+                    "exit_code": record["exit_code"],
+                    "wall_seconds": record["wall_seconds"],
+                    "primary_metric": record["primary_metric"],
+                    "aux_metrics": record["aux_metrics"],
+                    "stdout_tail": record["stdout_tail"],
+                    "stderr_tail": record["stderr_tail"],
+                },
+            )
+
+            if ok:
+                success_metrics.append(float(record["primary_metric"]))
+                success_wall.append(float(record["wall_seconds"]))
+                for key, val in record["aux_metrics"].items():
+                    aux_values.setdefault(key, []).append(float(val))
+            else:
+                failed_runs += 1
+                if settings.strict:
+                    raise BenchmarkAbort(
+                        f"Backend '{name}' run {i} failed (exit={record['exit_code']}, metric={record['primary_metric']})."
+                    )
+    except BenchmarkAbort as exc:
+        exc.row = result_row("aborted")
+        raise
+    finally:
+        if worker is not None:
+            worker.close()
+
+    return result_row("ok" if success_metrics else "failed")
+
+
+def run_backend_group(
+    group: Sequence[Tuple[Dict[str, Any], str]],
+    settings: RunSettings,
+    abort: threading.Event,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Run backends that share a device group one after another.
+
+    Returns the finished rows plus the abort reason if a strict-mode failure
+    stopped this group. Other groups notice ``abort`` and stop starting new
+    backends.
+    """
+    rows: List[Dict[str, Any]] = []
+    for backend, command in group:
+        if abort.is_set():
+            break
+        try:
+            rows.append(run_backend(backend, command, settings))
+        except BenchmarkAbort as exc:
+            abort.set()
+            if exc.row is not None:
+                rows.append(exc.row)
+            return rows, str(exc)
+    return rows, None
+
+
 def main() -> int:
     args = parse_args()
     config_path = (REPO_ROOT / args.config) if not Path(args.config).is_absolute() else Path(args.config)
@@ -489,18 +1143,20 @@ def main() -> int:
     print(f"Runs: {runs}, warmup: {warmup_runs}, timeout: {timeout_s}s")
 
     backend_commands: Dict[str, str] = {}
+    selected_backends: List[Dict[str, Any]] = []
     for backend in backends:
         if backend.get("enabled", True) is False:
             continue
         name = str(backend.get("name", "")).strip()
         if not name:
             raise ValueError("Each backend must have a non-empty 'name'")
-        if not backend_is_selected(name, backend_filters):
+        if not backend_is_selected(name.lower(), backend_filters):
             continue
         command_tmpl = str(backend.get("command", "")).strip()
         if not command_tmpl:
             raise ValueError(f"Backend '{name}' is missing 'command'")
         backend_commands[name] = format_command(command_tmpl, variables)
+        selected_backends.append(backend)
 
     if not backend_commands:
         requested = args.backend if args.backend else "<none>"
@@ -516,164 +1172,101 @@ def main() -> int:
             print(f"- {name}: {command}")
         return 0
 
-    result_rows: List[Dict[str, Any]] = []
-
-    for backend in backends:
-        if backend.get("enabled", True) is False:
-            continue
-
-        name = str(backend["name"])
-        if name not in backend_commands:
-            continue
-        command = backend_commands[name]
-        cwd_raw = str(backend.get("cwd", "."))
-        cwd_path = (REPO_ROOT / cwd_raw) if not Path(cwd_raw).is_absolute() else Path(cwd_raw)
-        env = os.environ.copy()
-        for k, v in backend.get("env", {}).items():
-            env[str(k)] = format_command(str(v), variables)
-
-        metric_regexes = normalize_regexes(backend.get("metric_regexes"))
-        if not metric_regexes:
-            parse_section = backend.get("parse", {})
-            metric_regexes = normalize_regexes(parse_section.get(metric.key))
-        if not metric_regexes and not metric_fallback_to_wall_time:
-            raise ValueError(
-                f"Backend '{name}' has no metric regexes for '{metric.key}' and fallback is disabled."
-            )
-
-        aux_regexes: Dict[str, List[str]] = {}
-        parse_section = backend.get("parse", {})
-        aux_section = backend.get("aux_metrics", {})
-        for key, value in aux_section.items():
-            aux_regexes[str(key)] = normalize_regexes(value)
-        for key, value in parse_section.items():
-            if key == metric.key:
-                continue
-            if key not in aux_regexes:
-                aux_regexes[str(key)] = normalize_regexes(value)
-
-        print(f"\n== Backend: {name} ==")
-        print(f"Command: {command}")
-        print(f"CWD: {cwd_path}")
+    now = datetime.now(timezone.utc)
+    default_output_dir = config.get("output_dir", "benchmarks/results/gguf")
+    out_dir = (REPO_ROOT / default_output_dir) if not Path(default_output_dir).is_absolute() else Path(default_output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stamp = now.strftime("%Y%m%d_%H%M%S")
+    stem = output_stem(config)
 
-        for i in range(1, warmup_runs + 1):
-            print(f"Warmup {i}/{warmup_runs}...")
-            try:
-                run_once(
-                    backend_name=name,
-                    command=command,
-                    cwd=cwd_path,
-                    timeout_s=timeout_s,
-                    env=env,
-                    metric_regexes=metric_regexes,
-                    aux_regexes=aux_regexes,
-                    metric_fallback_to_wall_time=metric_fallback_to_wall_time,
-                )
-            except subprocess.TimeoutExpired:
-                if strict:
-                    raise
-                print("Warmup timeout (continuing because strict=false).")
+    output_json = (
+        Path(args.output_json)
+        if args.output_json
+        else out_dir / f"{stem}_{stamp}.json"
+    )
+    output_md = (
+        Path(args.output_md)
+        if args.output_md
+        else out_dir / f"{stem}_{stamp}.md"
+    )
+    output_html = (
+        Path(args.output_html)
+        if args.output_html
+        else out_dir / f"{stem}_{stamp}.html"
+    )
 
-        measured_runs: List[Dict[str, Any]] = []
-        success_metrics: List[float] = []
-        success_wall: List[float] = []
-        aux_values: Dict[str, List[float]] = {}
-        failed_runs = 0
+    output_json = (REPO_ROOT / output_json) if not output_json.is_absolute() else output_json
+    output_md = (REPO_ROOT / output_md) if not output_md.is_absolute() else output_md
+    output_html = (REPO_ROOT / output_html) if not output_html.is_absolute() else output_html
 
-        for i in range(1, runs + 1):
-            print(f"Run {i}/{runs}...")
-            try:
-                record = run_once(
-                    backend_name=name,
-                    command=command,
-                    cwd=cwd_path,
-                    timeout_s=timeout_s,
-                    env=env,
-                    metric_regexes=metric_regexes,
-                    aux_regexes=aux_regexes,
-                    metric_fallback_to_wall_time=metric_fallback_to_wall_time,
-                )
-            except subprocess.TimeoutExpired:
-                failed_runs += 1
-                measured_runs.append(
-                    {
-                        "run_index": i,
-                        "ok": False,
-                        "error": f"timeout after {timeout_s}s",
-                    }
-                )
-                if strict:
-                    print("Timeout in strict mode; aborting benchmark.", file=sys.stderr)
-                    return 2
-                continue
+    output_json.parent.mkdir(parents=True, exist_ok=True)
+    output_md.parent.mkdir(parents=True, exist_ok=True)
+    output_html.parent.mkdir(parents=True, exist_ok=True)
 
-            ok = (record["exit_code"] == 0) and (record["primary_metric"] is not None)
-            measured_runs.append(
-                {
-                    "run_index": i,
-                    "ok": ok,
-                    "exit_code": record["exit_code"],
-                    "wall_seconds": record["wall_seconds"],
-                    "primary_metric": record["primary_metric"],
-                    "aux_metrics": record["aux_metrics"],
-                    "stdout_tail": (record["stdout"] or "")[-1200:],
-                    "stderr_tail": (record["stderr"] or "")[-1200:],
-                }
-            )
+    # Per-run records stream to a sidecar as they finish instead of piling up in memory.
+    output_runs = output_json.with_suffix(".runs.ndjson")
+    run_log = RunLog(output_runs)
+
+    base_env = os.environ.copy()
+    for k, v in config.get("common_env", {}).items():
+        base_env[str(k)] = format_command(str(v), variables)
+
+    settings = RunSettings(
+        metric=metric,
+        variables=variables,
+        base_env=base_env,
+        runs=runs,
+        warmup_runs=warmup_runs,
+        timeout_s=timeout_s,
+        strict=strict,
+        metric_fallback_to_wall_time=metric_fallback_to_wall_time,
+        run_log=run_log,
+    )
 
-            if ok:
-                success_metrics.append(float(record["primary_metric"]))
-                success_wall.append(float(record["wall_seconds"]))
-                for key, val in record["aux_metrics"].items():
-                    aux_values.setdefault(key, []).append(float(val))
-            else:
-                failed_runs += 1
-                if strict:
-                    print(
-                        f"Backend '{name}' run {i} failed (exit={record['exit_code']}, metric={record['primary_metric']}).",
-                        file=sys.stderr,
-                    )
-                    return 2
-
-        summary = {
-            "primary_metric": summarize(success_metrics),
-            "wall_seconds": summarize(success_wall),
-            "success_runs": len(success_metrics),
-            "failed_runs": failed_runs,
-            "aux_metrics": {k: summarize(v) for k, v in aux_values.items()},
-        }
-        status = "ok" if success_metrics else "failed"
-
-        result_rows.append(
-            {
-                "name": name,
-                "status": status,
-                "command": command,
-                "cwd": to_posix(cwd_path),
-                "runs": measured_runs,
-                "summary": summary,
-            }
-        )
+    # Backends sharing a device group contend for the same hardware, so each
+    # group runs serially; distinct groups may overlap up to the pool size.
+    groups: Dict[str, List[Tuple[Dict[str, Any], str]]] = {}
+    for backend in selected_backends:
+        name = str(backend["name"])
+        group_key = str(backend.get("device_group", name))
+        groups.setdefault(group_key, []).append((backend, backend_commands[name]))
 
-    good = [
-        row
-        for row in result_rows
-        if row["status"] == "ok"
-        and row.get("summary", {}).get("primary_metric", {}).get("median") is not None
-    ]
+    max_parallel = max(1, int(config.get("max_parallel_backends", 1)))
+    abort = threading.Event()
+    rows_by_name: Dict[str, Dict[str, Any]] = {}
+    abort_reason: Optional[str] = None
+    try:
+        with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+            futures = [pool.submit(run_backend_group, group, settings, abort) for group in groups.values()]
+            for future in as_completed(futures):
+                group_rows, group_abort = future.result()
+                for row in group_rows:
+                    rows_by_name[row["name"]] = row
+                if group_abort is not None and abort_reason is None:
+                    abort_reason = group_abort
+                    log(f"{group_abort} Aborting benchmark; writing partial results.", error=True)
+    finally:
+        run_log.close()
+
+    result_rows = [rows_by_name[name] for name in backend_commands if name in rows_by_name]
+
+    # Pull each successful row's median out once; both passes below reuse it.
+    good: List[Tuple[Dict[str, Any], float]] = []
+    for row in result_rows:
+        med_raw = row.get("summary", {}).get("primary_metric", {}).get("median")
+        if row["status"] == "ok" and med_raw is not None:
+            good.append((row, float(med_raw)))
     best_median: Optional[float] = None
     if good:
-        medians = [float(row["summary"]["primary_metric"]["median"]) for row in good]
+        medians = [med for _, med in good]
         best_median = max(medians) if metric.direction == "higher" else min(medians)
         if best_median > 0:
-            for row in good:
-                med = float(row["summary"]["primary_metric"]["median"])
+            for row, med in good:
                 if metric.direction == "higher":
                     row["summary"]["median_vs_best"] = med / best_median
                 else:
                     row["summary"]["median_vs_best"] = best_median / med if med else 0.0
 
-    now = datetime.now(timezone.utc)
     benchmark_result = {
         "benchmark": {
             "benchmark_name": str(config.get("benchmark_name", "gguf_compare")),
@@ -692,56 +1285,29 @@ def main() -> int:
                 "direction": metric.direction,
             },
             "strict": strict,
+            "status": "aborted" if abort_reason is not None else "completed",
+            "abort_reason": abort_reason,
         },
         "results": result_rows,
+        "runs_ndjson": output_runs.as_posix(),
     }
 
-    default_output_dir = config.get("output_dir", "benchmarks/results/gguf")
-    out_dir = (REPO_ROOT / default_output_dir) if not Path(default_output_dir).is_absolute() else Path(default_output_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-    stamp = now.strftime("%Y%m%d_%H%M%S")
-    stem = output_stem(config)
-
-    output_json = (
-        Path(args.output_json)
-        if args.output_json
-        else out_dir / f"{stem}_{stamp}.json"
-    )
-    output_md = (
-        Path(args.output_md)
-        if args.output_md
-        else out_dir / f"{stem}_{stamp}.md"
-    )
-    output_html = (
-        Path(args.output_html)
-        if args.output_html
-        else out_dir / f"{stem}_{stamp}.html"
-    )
-
-    output_json = (REPO_ROOT / output_json) if not output_json.is_absolute() else output_json
-    output_md = (REPO_ROOT / output_md) if not output_md.is_absolute() else output_md
-    output_html = (REPO_ROOT / output_html) if not output_html.is_absolute() else output_html
-
-    output_json.parent.mkdir(parents=True, exist_ok=True)
-    output_md.parent.mkdir(parents=True, exist_ok=True)
-    output_html.parent.mkdir(parents=True, exist_ok=True)
-
-    with output_json.open("w", encoding="utf-8") as f:
-        json.dump(benchmark_result, f, indent=2)
+    output_json.write_bytes(json_dumps_indented(benchmark_result))
     with output_md.open("w", encoding="utf-8") as f:
         f.write(generate_markdown_report(benchmark_result, metric))
     with output_html.open("w", encoding="utf-8") as f:
         f.write(generate_html_report(benchmark_result, metric))
 
-    print("\nBenchmark completed.")
+    print("\nBenchmark aborted; partial results written." if abort_reason is not None else "\nBenchmark completed.")
     print(f"- JSON: {output_json}")
+    print(f"- Runs (NDJSON): {output_runs}")
     print(f"- Markdown: {output_md}")
     print(f"- HTML: {output_html}")
 
     if best_median is not None:
         print(f"- Best median {metric.key}: {best_median:.4f} {metric.unit}")
 
-    return 0
+    return 2 if abort_reason is not None else 0
 
 
 if __name__ == "__main__":
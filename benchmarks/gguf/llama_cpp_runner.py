@@ -6,19 +6,31 @@ Prints parseable metrics for gguf_compare.py:
 - tokens/sec
 - prompt_eval_ms
 - peak_vram_gb (0.0 for CPU path)
+
+With --server the model is loaded once and the runner answers one JSON
+request per stdin line ({"prompt": ..., "max_tokens": ..., "stop": [...]}),
+printing the same metric lines followed by an end marker (on stderr, then on
+stdout) after each request. The model's KV cache and sampler seed are reset
+before every request so each one does the same work as a fresh process.
 """
 
 from __future__ import annotations
 
 import argparse
+import json
+import sys
 import time
-from typing import Any, Dict
+from typing import Any, Dict, List
+
+# Handshake lines for --server mode; must match gguf_compare.py.
+READY_MARKER = "==READY=="
+END_MARKER = "==END=="
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run GGUF inference with llama-cpp-python.")
     parser.add_argument("--model", required=True)
-    parser.add_argument("--prompt", required=True)
+    parser.add_argument("--prompt", default=None, help="Required unless --server is given.")
     parser.add_argument("--max-tokens", type=int, default=128)
     parser.add_argument("--n-ctx", type=int, default=2048)
     parser.add_argument("--threads", type=int, default=0, help="0 => auto")
@@ -26,8 +38,32 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--temperature", type=float, default=0.7)
     parser.add_argument("--top-p", type=float, default=0.95)
     parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--n-batch", type=int, default=512, help="Prompt-eval batch size.")
+    parser.add_argument("--n-ubatch", type=int, default=512, help="Physical micro-batch size.")
+    parser.add_argument(
+        "--use-mmap",
+        dest="use_mmap",
+        action="store_true",
+        default=True,
+        help="Memory-map the model file (default).",
+    )
+    parser.add_argument("--no-use-mmap", dest="use_mmap", action="store_false", help="Read the model into memory.")
+    parser.add_argument("--use-mlock", action="store_true", help="Lock model pages in RAM to avoid swapping.")
+    parser.add_argument(
+        "--stop",
+        default="",
+        help="Comma-separated stop sequences; generation ends early when one is produced.",
+    )
     parser.add_argument("--echo", action="store_true", help="Print generated text.")
-    return parser.parse_args()
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Keep the model loaded and serve JSON requests read from stdin.",
+    )
+    args = parser.parse_args()
+    if args.prompt is None and not args.server:
+        parser.error("--prompt is required unless --server is given")
+    return args
 
 
 def main() -> int:
@@ -46,19 +82,40 @@ def main() -> int:
         "n_gpu_layers": args.n_gpu_layers,
         "verbose": False,
         "seed": args.seed,
+        "n_batch": args.n_batch,
+        "n_ubatch": args.n_ubatch,
+        "use_mmap": args.use_mmap,
+        "use_mlock": args.use_mlock,
     }
     if args.threads > 0:
         llama_kwargs["n_threads"] = args.threads
 
     model = Llama(**llama_kwargs)
 
+    if args.server:
+        return serve(model, args)
+    run_completion(model, args, args.prompt, args.max_tokens, parse_stop(args.stop))
+    return 0
+
+
+def parse_stop(raw: str) -> List[str]:
+    return [item for item in raw.split(",") if item]
+
+
+def run_completion(
+    model: Any,
+    args: argparse.Namespace,
+    prompt: str,
+    max_tokens: int,
+    stop: List[str],
+) -> None:
     start = time.perf_counter()
     output = model.create_completion(
-        prompt=args.prompt,
-        max_tokens=args.max_tokens,
+        prompt=prompt,
+        max_tokens=max_tokens,
         temperature=args.temperature,
         top_p=args.top_p,
-        stop=[],
+        stop=stop,
     )
     end = time.perf_counter()
     elapsed_s = max(1e-9, end - start)
@@ -93,6 +150,30 @@ def main() -> int:
         print(text)
         print("output_text_end")
 
+
+def serve(model: Any, args: argparse.Namespace) -> int:
+    default_stop = parse_stop(args.stop)
+    print(READY_MARKER, flush=True)
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            prompt = str(request.get("prompt", args.prompt or ""))
+            max_tokens = int(request.get("max_tokens", args.max_tokens))
+            stop = [str(item) for item in request.get("stop", default_stop)]
+            # Without a reset the repeated prompt would hit the prefix cache and
+            # skip prompt eval, and sampling would continue the previous RNG state.
+            model.reset()
+            model.set_seed(args.seed)
+            run_completion(model, args, prompt, max_tokens, stop)
+        except Exception as exc:
+            # Keep serving; the harness sees a run without metrics.
+            print(f"request failed: {exc}")
+        sys.stdout.flush()
+        print(END_MARKER, file=sys.stderr, flush=True)
+        print(END_MARKER, flush=True)
     return 0
 
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import argparse
 import random
+import sys
 import time
 
 
@@ -23,18 +24,31 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
-    random.seed(time.time_ns())
-
-    tps = random.uniform(args.min_tps, args.max_tps)
-    prompt_ms = args.prompt_ms * random.uniform(0.96, 1.04)
-    vram = args.vram_gb * random.uniform(0.99, 1.01)
-
-    time.sleep(max(0.0, args.sleep_ms) / 1000.0)
-
-    print(f"backend={args.backend}")
-    print(f"tokens/sec: {tps:.4f}")
-    print(f"prompt_eval_ms: {prompt_ms:.4f}")
-    print(f"peak_vram_gb: {vram:.4f}")
+    rng = random.Random(time.time_ns())
+
+    tps = rng.uniform(args.min_tps, args.max_tps)
+    prompt_ms = args.prompt_ms * rng.uniform(0.96, 1.04)
+    vram = args.vram_gb * rng.uniform(0.99, 1.01)
+
+    sleep_ms = max(0.0, args.sleep_ms)
+    if sleep_ms < 1.0:
+        # Sub-millisecond delays: spin rather than pay sleep()'s syscall and wake-up jitter.
+        deadline = time.perf_counter_ns() + int(sleep_ms * 1e6)
+        while time.perf_counter_ns() < deadline:
+            pass
+    else:
+        time.sleep(sleep_ms / 1000.0)
+
+    # One write for the whole report, straight to the byte stream.
+    sys.stdout.buffer.write(
+        (
+            f"backend={args.backend}\n"
+            f"tokens/sec: {tps:.4f}\n"
+            f"prompt_eval_ms: {prompt_ms:.4f}\n"
+            f"peak_vram_gb: {vram:.4f}\n"
+        ).encode()
+    )
+    sys.stdout.flush()
     return 0
 
 
@@ -5,102 +5,235 @@ This script runs performance benchmarks for function calls, loops, I/O operation
 and compilation speed to validate Phase 3 implementation performance.
 """
 
+import argparse
 import os
 import sys
 import time
 import subprocess
 import statistics
+import tempfile
+import threading
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, Optional
+
+try:
+    # Optional: vectorized timing statistics
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional: faster JSON serialization for result files
+    import orjson
+except ImportError:
+    orjson = None
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+def _get_executor(max_workers: int) -> ProcessPoolExecutor:
+    """Return the shared worker pool with max_workers processes, creating it on first use"""
+    global _executor, _executor_workers
+    if _executor is None or _executor_workers != max_workers:
+        if _executor is not None:
+            _executor.shutdown()
+        _executor = ProcessPoolExecutor(max_workers=max_workers)
+        _executor_workers = max_workers
+    return _executor
+
+def _run_timed(argv: List[str], timeout: float, cwd: Optional[Path] = None) -> Tuple[int, int, bytes]:
+    """Run argv to completion and return (returncode, elapsed_ns, stderr)"""
+    # stderr goes to a temp file rather than a pipe so a chatty child can never
+    # block on a full pipe while we are waiting for its exit
+    with tempfile.TemporaryFile() as err:
+        start_ns = time.monotonic_ns()
+        proc = subprocess.Popen(argv, cwd=cwd, stdout=subprocess.DEVNULL, stderr=err)
+        # Block in the OS wait for the child's exit rather than polling, so the
+        # end timestamp is taken as soon as it exits; a timer enforces the timeout
+        timed_out = threading.Event()
+        def _kill():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        try:
+            proc.wait()
+        finally:
+            timer.cancel()
+        end_ns = time.monotonic_ns()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(argv, timeout)
+        
+        stderr = b""
+        if proc.returncode != 0:
+            err.seek(0)
+            stderr = err.read()
+    return proc.returncode, end_ns - start_ns, stderr
+
+def _one_compile(source_file: Path, compiler_cmd: Tuple[str, ...], compiler_path: Path) -> Optional[float]:
+    """Compile source_file once and return the elapsed time, or None on failure"""
+    argv = [*compiler_cmd, str(source_file)]
+    
+    try:
+        # Run the Aero compiler
+        # Only stderr is kept, and only decoded if the compile fails
+        returncode, elapsed_ns, stderr = _run_timed(argv, timeout=30, cwd=compiler_path)
+        
+        if returncode == 0:
+            return elapsed_ns / 1e9
+        print(f"Compilation failed for {source_file}: {stderr.decode(errors='replace')}")
+            
+    except subprocess.TimeoutExpired:
+        print(f"Compilation timeout for {source_file}")
+    except Exception as e:
+        print(f"Error running compilation benchmark: {e}")
+    return None
+
+def _one_execution(executable_path: Path) -> Optional[float]:
+    """Run executable_path once and return the elapsed time, or None on failure"""
+    argv = [str(executable_path)]
+    
+    try:
+        returncode, elapsed_ns, stderr = _run_timed(argv, timeout=10)
+        
+        if returncode == 0:
+            return elapsed_ns / 1e9
+        print(f"Execution failed for {executable_path}: {stderr.decode(errors='replace')}")
+            
+    except subprocess.TimeoutExpired:
+        print(f"Execution timeout for {executable_path}")
+    except Exception as e:
+        print(f"Error running execution benchmark: {e}")
+    return None
+
+def _collect_times(results: Iterable[Optional[float]], iterations: int) -> Sequence[float]:
+    """Gather successful timings, into a preallocated array when NumPy is available"""
+    if np is None:
+        return [t for t in results if t is not None]
+    times = np.empty(iterations, dtype=np.float64)
+    count = 0
+    for t in results:
+        if t is not None:
+            times[count] = t
+            count += 1
+    return times[:count]
+
+def _run_iterations(fn: Callable[..., Optional[float]], iterations: int, *args, max_workers: int = 1) -> Sequence[float]:
+    """Run fn(*args) iterations times, overlapping up to max_workers of them"""
+    if max_workers <= 1 or iterations == 1:
+        results = [fn(*args) for _ in range(iterations)]
+    else:
+        results = _get_executor(max_workers).map(fn, *([arg] * iterations for arg in args))
+    return _collect_times(results, iterations)
+
+def _summarize_times(times: Sequence[float], error: str) -> Dict:
+    """Summary statistics for a list of timings, or an error entry if empty"""
+    if len(times) > 0 and np is not None:
+        arr = np.asarray(times, dtype=np.float64)
+        return {
+            "mean": float(arr.mean()),
+            "median": float(np.median(arr)),
+            "min": float(arr.min()),
+            "max": float(arr.max()),
+            "std_dev": float(arr.std(ddof=1)) if len(arr) > 1 else 0,
+            "iterations": len(arr)
+        }
+    elif len(times) > 0:
+        return {
+            "mean": statistics.mean(times),
+            "median": statistics.median(times),
+            "min": min(times),
+            "max": max(times),
+            "std_dev": statistics.stdev(times) if len(times) > 1 else 0,
+            "iterations": len(times)
+        }
+    else:
+        return {"error": error}
+
+def _dump_json(obj, path: Path):
+    """Write obj to path as indented JSON, using orjson when available"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
 
 class AeroBenchmark:
-    def __init__(self, aero_root: Path):
+    def __init__(self, aero_root: Path, max_workers: int = 1):
         self.aero_root = aero_root
         self.compiler_path = aero_root / "src" / "compiler"
         self.benchmarks_dir = aero_root / "benchmarks" / "aero"
         self.results = {}
+        self.checkpoint_files: List[Path] = []
+        self.aero_binary = self._ensure_built()
+        if self.aero_binary is not None:
+            self.compiler_cmd: Tuple[str, ...] = (str(self.aero_binary),)
+        else:
+            # Fall back to letting cargo build and run on every invocation
+            self.compiler_cmd = ("cargo", "run", "--release", "--")
+        # Overlapping timed runs measure latency under load rather than
+        # per-compile time, so iterations run one at a time unless asked
+        self.max_workers = max(1, max_workers)
+        if self.aero_binary is None and self.max_workers > 1:
+            # Concurrent cargo runs serialize on the target directory lock,
+            # which would be counted as compile time
+            print("Note: running iterations serially because cargo run is the compiler command")
+            self.max_workers = 1
         
-    def run_compilation_benchmark(self, source_file: Path, iterations: int = 10) -> Dict:
-        """Run compilation benchmark for a given source file"""
-        times = []
+    def _ensure_built(self) -> Optional[Path]:
+        """Build the release compiler once and return its binary path, if found"""
+        try:
+            result = subprocess.run(["cargo", "build", "--release"],
+                                    cwd=self.compiler_path,
+                                    capture_output=True,
+                                    text=True)
+        except OSError as e:
+            print(f"Could not run cargo build: {e}")
+            return None
+        if result.returncode != 0:
+            print(f"cargo build --release failed: {result.stderr}")
+            return None
         
-        for i in range(iterations):
-            start_time = time.perf_counter()
-            
-            try:
-                # Run the Aero compiler
-                result = subprocess.run([
-                    "cargo", "run", "--release", "--", str(source_file)
-                ], 
-                cwd=self.compiler_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-                )
-                
-                end_time = time.perf_counter()
-                compilation_time = end_time - start_time
-                
-                if result.returncode == 0:
-                    times.append(compilation_time)
-                else:
-                    print(f"Compilation failed for {source_file}: {result.stderr}")
-                    
-            except subprocess.TimeoutExpired:
-                print(f"Compilation timeout for {source_file}")
-            except Exception as e:
-                print(f"Error running compilation benchmark: {e}")
+        binary_name = "aero.exe" if os.name == "nt" else "aero"
+        binary = self.compiler_path / "target" / "release" / binary_name
+        if binary.exists():
+            return binary
+        print(f"Warning: {binary} not found after build; falling back to cargo run")
+        return None
         
-        if times:
-            return {
-                "mean": statistics.mean(times),
-                "median": statistics.median(times),
-                "min": min(times),
-                "max": max(times),
-                "std_dev": statistics.stdev(times) if len(times) > 1 else 0,
-                "iterations": len(times)
-            }
-        else:
-            return {"error": "No successful compilations"}
+    def run_compilation_benchmark(self, source_file: Path, iterations: int = 10, warmup_runs: int = 1) -> Dict:
+        """Run compilation benchmark for a given source file after discarded warmup compiles"""
+        # Warmup pass: pay cold page cache and loader costs outside the sample
+        for _ in range(warmup_runs):
+            _one_compile(source_file, self.compiler_cmd, self.compiler_path)
+        times = _run_iterations(_one_compile, iterations, source_file, self.compiler_cmd, self.compiler_path,
+                                max_workers=self.max_workers)
+        return self._with_warmup(_summarize_times(times, "No successful compilations"), warmup_runs)
+    
+    def run_compilation_batch(self, source_files: List[Path], iterations: int = 10, warmup_runs: int = 1) -> Dict[Path, Dict]:
+        """Run compilation benchmarks for several files, one file at a time"""
+        # The compiler takes a single input per invocation, so there is no
+        # startup to amortize across files; each file's iterations still use
+        # the pool when --jobs allows it
+        results = {}
+        for source_file in source_files:
+            print(f"  Benchmarking {source_file.name}...")
+            results[source_file] = self.run_compilation_benchmark(source_file, iterations, warmup_runs)
+        return results
+    
+    @staticmethod
+    def _with_warmup(summary: Dict, warmup_runs: int) -> Dict:
+        """Record how many discarded warmup runs preceded a successful sample"""
+        if "error" not in summary:
+            summary["warmup_runs"] = warmup_runs
+        return summary
     
     def run_execution_benchmark(self, executable_path: Path, iterations: int = 5) -> Dict:
         """Run execution benchmark for a compiled program"""
-        times = []
-        
-        for i in range(iterations):
-            start_time = time.perf_counter()
-            
-            try:
-                result = subprocess.run([str(executable_path)], 
-                                      capture_output=True, 
-                                      text=True, 
-                                      timeout=10)
-                
-                end_time = time.perf_counter()
-                execution_time = end_time - start_time
-                
-                if result.returncode == 0:
-                    times.append(execution_time)
-                else:
-                    print(f"Execution failed for {executable_path}: {result.stderr}")
-                    
-            except subprocess.TimeoutExpired:
-                print(f"Execution timeout for {executable_path}")
-            except Exception as e:
-                print(f"Error running execution benchmark: {e}")
-        
-        if times:
-            return {
-                "mean": statistics.mean(times),
-                "median": statistics.median(times),
-                "min": min(times),
-                "max": max(times),
-                "std_dev": statistics.stdev(times) if len(times) > 1 else 0,
-                "iterations": len(times)
-            }
-        else:
-            return {"error": "No successful executions"}
+        times = _run_iterations(_one_execution, iterations, executable_path, max_workers=self.max_workers)
+        return _summarize_times(times, "No successful executions")
     
     def benchmark_function_performance(self) -> Dict:
         """Benchmark function call overhead and performance"""
@@ -180,19 +313,18 @@ class AeroBenchmark:
         examples_dir = self.aero_root / "examples"
         
         if examples_dir.exists():
-            for file_path in examples_dir.glob("*.aero"):
-                example_files.append(file_path)
+            # DirEntry caches its stat result, so each size costs one syscall
+            with os.scandir(examples_dir) as it:
+                example_files = [(Path(e.path), e.stat().st_size)
+                                 for e in it if e.name.endswith(".aero") and e.is_file()]
         
         results = {}
         
-        for file_path in example_files:
-            print(f"  Benchmarking compilation of {file_path.name}...")
-            
-            # Get file size for context
-            file_size = file_path.stat().st_size
-            
+        compilations = self.run_compilation_batch([file_path for file_path, _ in example_files])
+        
+        for file_path, file_size in example_files:
             results[file_path.name] = {
-                "compilation": self.run_compilation_benchmark(file_path),
+                "compilation": compilations[file_path],
                 "file_size_bytes": file_size,
                 "description": f"Compilation speed for {file_path.name}"
             }
@@ -236,50 +368,63 @@ fn main() {
         }
         
         results = {}
-        temp_dir = self.aero_root / "temp_benchmarks"
-        temp_dir.mkdir(exist_ok=True)
         
-        try:
+        # The directory and everything the compiler writes into it are
+        # removed when the block exits, even if a benchmark raises
+        with tempfile.TemporaryDirectory(prefix="temp_benchmarks_", dir=self.aero_root) as td:
+            temp_dir = Path(td)
+            temp_files = {}
             for program_name, program_code in test_programs.items():
                 temp_file = temp_dir / program_name
                 temp_file.write_text(program_code)
-                
-                print(f"  Benchmarking {program_name}...")
+                temp_files[program_name] = temp_file
+            
+            compilations = self.run_compilation_batch(list(temp_files.values()))
+            for program_name, temp_file in temp_files.items():
                 results[program_name] = {
-                    "compilation": self.run_compilation_benchmark(temp_file),
+                    "compilation": compilations[temp_file],
                     "description": f"Regression test for {program_name}"
                 }
-        finally:
-            # Clean up temporary files
-            for temp_file in temp_dir.glob("*.aero"):
-                temp_file.unlink()
-            temp_dir.rmdir()
                 
         return results
     
-    def run_all_benchmarks(self) -> Dict:
-        """Run all performance benchmarks"""
+    def run_all_benchmarks(self, checkpoint_dir: Optional[Path] = None, run_stamp: str = "") -> Dict:
+        """Run all performance benchmarks, checkpointing each suite to checkpoint_dir if given"""
         print("=== Aero Phase 3 Performance Benchmarks ===")
         print()
         
         all_results = {
             "timestamp": time.time(),
-            "benchmarks": {
-                "function_performance": self.benchmark_function_performance(),
-                "loop_performance": self.benchmark_loop_performance(),
-                "io_performance": self.benchmark_io_performance(),
-                "compilation_speed": self.benchmark_compilation_speed(),
-                "performance_regression": self.benchmark_performance_regression()
-            }
+            "benchmarks": {}
         }
         
+        suites = [
+            ("function_performance", self.benchmark_function_performance),
+            ("loop_performance", self.benchmark_loop_performance),
+            ("io_performance", self.benchmark_io_performance),
+            ("compilation_speed", self.benchmark_compilation_speed),
+            ("performance_regression", self.benchmark_performance_regression)
+        ]
+        for name, run in suites:
+            all_results["benchmarks"][name] = run()
+            if checkpoint_dir is not None:
+                # Keep finished suites on disk in case a later one crashes or is
+                # interrupted. The run stamp tells runs apart, and the name stays
+                # outside generate_report.py's performance_results_*.json glob.
+                partial = checkpoint_dir / f"partial_{name}_{run_stamp}.json"
+                _dump_json(all_results["benchmarks"][name], partial)
+                self.checkpoint_files.append(partial)
+        
         return all_results
     
     def save_results(self, results: Dict, output_file: Path):
         """Save benchmark results to JSON file"""
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        _dump_json(results, output_file)
         print(f"Results saved to {output_file}")
+        # The full results supersede the per-suite checkpoints
+        for partial in self.checkpoint_files:
+            partial.unlink(missing_ok=True)
+        self.checkpoint_files = []
     
     def print_summary(self, results: Dict):
         """Print a summary of benchmark results"""
@@ -297,6 +442,11 @@ fn main() {
                         print(f"  {test_name}: {comp_results['error']}")
 
 def main():
+    parser = argparse.ArgumentParser(description="Aero performance benchmarks")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Timed runs allowed to overlap (default 1; values above 1 measure latency under load)")
+    args = parser.parse_args()
+    
     # Find the Aero root directory
     current_dir = Path(__file__).parent
     aero_root = current_dir.parent
@@ -306,14 +456,16 @@ def main():
         sys.exit(1)
     
     # Create benchmark runner
-    benchmark = AeroBenchmark(aero_root)
+    benchmark = AeroBenchmark(aero_root, max_workers=args.jobs)
+    
+    run_stamp = str(int(time.time()))
+    results_file = aero_root / "benchmarks" / "results" / f"performance_results_{run_stamp}.json"
+    results_file.parent.mkdir(exist_ok=True)
     
     # Run all benchmarks
-    results = benchmark.run_all_benchmarks()
+    results = benchmark.run_all_benchmarks(checkpoint_dir=results_file.parent, run_stamp=run_stamp)
     
     # Save results
-    results_file = aero_root / "benchmarks" / "results" / f"performance_results_{int(time.time())}.json"
-    results_file.parent.mkdir(exist_ok=True)
     benchmark.save_results(results, results_file)
     
     # Print summary